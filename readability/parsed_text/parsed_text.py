@@ -59,12 +59,14 @@ class ParsedText:
         self.statistics["vocabulary"] = set()
         for sentence in self.content:
             self.statistics["totalWords"] += len(sentence)
-            self.statistics["totalLongWords"] += len([token for token in sentence if len(token)>6])
-            self.statistics["totalCharacters"] += sum(len(token) for token in sentence)
-            self.statistics["totalSyllables"] += sum(utils.syllablesplit(word) for word in sentence)
-            self.statistics["nbPolysyllables"] += sum(utils.syllablesplit(word) for word in sentence if utils.syllablesplit(word)>=3)
-            #self.statistics["nbPolysyllables"] += sum(1 for word in sentence if utils.syllablesplit(word)>=3)
+            self.statistics["totalLongWords"] += sum(1 for token in sentence if len(token)>6)
+            self.statistics["totalCharacters"] += sum(map(len, sentence))
             for token in sentence:
+                syllables = utils.syllablesplit(token)
+                self.statistics["totalSyllables"] += syllables
+                if syllables >= 3:
+                    self.statistics["nbPolysyllables"] += syllables
+                    #self.statistics["nbPolysyllables"] += 1
                 self.statistics["vocabulary"].add(token)
             
     
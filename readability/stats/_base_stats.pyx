@@ -0,0 +1,40 @@
+# cython: language_level=3
+"""
+The _base_stats extension is a compiled version of the base statistics pass of the common_scores module.
+
+It is only used when it was built alongside the package, common_scores falling back to its numpy version otherwise.
+"""
+
+def count_base_stats(list text, syl):
+    """
+    Walks through a text once in order to obtain the values shared by every score of the common_scores module, using C counters.
+
+    :param text: Content of a text, distincting between sentences.
+    :type text: list(list(str))
+    :param syl: Function returning the number of syllables of a word.
+    :type syl: callable
+    :return: totalWords, totalSentences, totalCharacters, totalSyllables, nbPolysyllables and totalLongWords, in that order.
+    :rtype: tuple(int)
+    """
+    cdef long totalWords = 0
+    cdef long totalCharacters = 0
+    cdef long totalSyllables = 0
+    cdef long nbPolysyllables = 0
+    cdef long totalLongWords = 0
+    cdef Py_ssize_t length
+    cdef long syllables
+    cdef list sent
+    cdef str token
+    for sent in text:
+        for token in sent:
+            length = len(token)
+            totalWords += 1
+            totalCharacters += length
+            if length > 6:
+                totalLongWords += 1
+            syllables = syl(token)
+            totalSyllables += syllables
+            # FIXME : same error as the one outlined in SMOG_score, kept for reproducibility.
+            if syllables >= 3:
+                nbPolysyllables += syllables
+    return totalWords, len(text), totalCharacters, totalSyllables, nbPolysyllables, totalLongWords
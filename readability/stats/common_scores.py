@@ -3,14 +3,129 @@ The common_scores module contains functions allowing to calculate readability sc
 
 The origin of these formulas, alongside a quick description of what they're meant to measure is presented in each function's documentation.
 Functions start with the uppercase acronym, and the suffix '_score'.
+The compute_all_scores and compute_all_scores_batch functions can also be used to obtain every score at once, for a text or a list of texts.
+score_corpus_into does the same as the latter, but writes the scores into a numpy array instead of a dataframe.
 """
 import math
-import pandas as pd
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
 
 from ..utils import utils
 
+# Coefficients of the formulas, shared by the functions calculating a single score and the ones calculating them for several texts.
+# The errors outlined in GFI_score and ARI_score come from how these are applied, not from their values.
+GFI_A, GFI_B = 0.4, 100.0
+ARI_A, ARI_B, ARI_C = 4.71, 0.5, 21.43
+FRE_A, FRE_B, FRE_C = 206.835, 1.015, 84.6
+FKGL_A, FKGL_B, FKGL_C = 0.39, 11.8, 15.59
+SMOG_A, SMOG_B, SMOG_SENTENCES = 1.043, 3.1291, 30.0
+REL_A, REL_B, REL_C = 207.0, 1.015, 73.6
+
+# The compiled version of the base statistics pass is only available if the extension was built when installing the package.
+try:
+    from ._base_stats import count_base_stats as _count_base_stats_compiled
+except ImportError:
+    _count_base_stats_compiled = None
+
+# Texts follow Zipf's law, so most tokens are repeated : syllables are only counted once per distinct word.
+_syl = lru_cache(maxsize=200_000)(utils.syllablesplit)
+
+def _syllables_many(words):
+    """Returns the number of syllables of each word of a list, as an array, only splitting each distinct word once."""
+    # Associates each distinct word with its index of first appearance, the inverse mapping each token to its word.
+    vocabulary = dict()
+    inverse = np.fromiter((vocabulary.setdefault(word, len(vocabulary)) for word in words), dtype=np.intp, count=len(words))
+    syllables = np.fromiter((_syl(word) for word in vocabulary), dtype=np.int32, count=len(vocabulary))
+    return syllables[inverse]
+
+class BaseStats:
+    """
+    The BaseStats class holds the values shared by every score of this module, as an alternative to the statistics dictionary of a ParsedText instance.
+
+    Values are stored in slots rather than in a dictionary, making them cheaper to access and to store when scoring many texts.
+    Score functions still accept a dictionary instead, which then only needs to contain the keys used by their formula.
+    List of attributes : totalWords, totalSentences, totalCharacters, totalSyllables, nbPolysyllables, totalLongWords
+    """
+    __slots__ = ("totalWords", "totalSentences", "totalCharacters", "totalSyllables", "nbPolysyllables", "totalLongWords")
+
+    def __init__(self, totalWords, totalSentences, totalCharacters, totalSyllables, nbPolysyllables, totalLongWords):
+        self.totalWords = totalWords
+        self.totalSentences = totalSentences
+        self.totalCharacters = totalCharacters
+        self.totalSyllables = totalSyllables
+        self.nbPolysyllables = nbPolysyllables
+        self.totalLongWords = totalLongWords
+
+    @classmethod
+    def from_dict(cls, statistics):
+        """Creates a BaseStats instance from a dictionary using the same keys, such as the statistics attribute of a ParsedText instance."""
+        return cls(*(statistics[field] for field in cls.__slots__))
+
+    def __repr__(self):
+        return "BaseStats(" + ", ".join(field + "=" + str(getattr(self, field)) for field in self.__slots__) + ")"
+
+# Below this number of tokens, building the numpy arrays costs more than the reductions save.
+_NUMPY_MIN_TOKENS = 2000
+
+def _count_base_stats_python(text):
+    """Same as _count_base_stats, using a plain loop over the tokens, which is faster for short texts."""
+    totalWords = 0
+    totalCharacters = 0
+    totalSyllables = 0
+    nbPolysyllables = 0
+    totalLongWords = 0
+    for sent in text:
+        totalWords += len(sent)
+        for token in sent:
+            length = len(token)
+            totalCharacters += length
+            if length > 6:
+                totalLongWords += 1
+            syllables = _syl(token)
+            totalSyllables += syllables
+            # FIXME : same error as the one outlined in SMOG_score, kept for reproducibility.
+            if syllables >= 3:
+                nbPolysyllables += syllables
+    return totalWords, len(text), totalCharacters, totalSyllables, nbPolysyllables, totalLongWords
 
 # Text "must" be a list of sentences, which are lists of words.
+def _count_base_stats(text):
+    """
+    Walks through a text once in order to obtain the values shared by every score of this module.
+
+    :param text: Content of a text, distincting between sentences.
+    :type text: list(list(str))
+    :return: totalWords, totalSentences, totalCharacters, totalSyllables, nbPolysyllables and totalLongWords, in that order.
+    :rtype: tuple(int)
+    """
+    if _count_base_stats_compiled is not None:
+        try:
+            return _count_base_stats_compiled(text, _syl)
+        except TypeError:
+            # The extension only accepts lists of lists of str, other sequences use the version below.
+            pass
+    if sum(map(len, text)) < _NUMPY_MIN_TOKENS:
+        return _count_base_stats_python(text)
+    # Only the per-token lookups stay in Python, the reductions are done by numpy.
+    tokens = [token for sent in text for token in sent]
+    lengths = np.fromiter(map(len, tokens), dtype=np.int32, count=len(tokens))
+    syllables = _syllables_many(tokens)
+    return (
+        int(lengths.size),
+        len(text),
+        int(lengths.sum()),
+        int(syllables.sum()),
+        # FIXME : same error as the one outlined in SMOG_score, kept for reproducibility.
+        int(syllables[syllables >= 3].sum()),
+        int((lengths > 6).sum()),
+    )
+
+def _compute_base_stats(text):
+    """Returns the values obtained from _count_base_stats as a BaseStats instance."""
+    return BaseStats(*_count_base_stats(text))
+
 def GFI_score(text, statistics=None):
     """
     Outputs the Gunning fog index, a 1952 readability test estimating the years of formal education needed to understand a text on the first reading.
@@ -20,25 +135,27 @@ def GFI_score(text, statistics=None):
     :param text: Content of a text, distincting between sentences.
     :type text: list(list(str)) or str 
     :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
-    :type statistics: readability.Statistics
-    :return: The Gunning fog index of the current text
+    :type statistics: dict or BaseStats
+    :return: The Gunning fog index of the current text, or nan if it has no sentences
     :rtype: float
     """
     # FIXME : this score is wrong since we divided by totalSentences instead of totalWords for the second ratio. Leaving as-is for now.
-    if statistics is not None:
-        return 0.4*((statistics["totalWords"]/statistics["totalSentences"]) + 100*statistics["totalLongWords"]/statistics["totalSentences"])
-    totalWords = 0
-    totalSentences = len(text)
-    totalLongWords = 0
-    for sent in text:
-        totalWords += len(sent)
-        totalLongWords += len([token for token in sent if len(token)>6])
-    if totalWords < 101:
-        #print("WARNING : Number of words is less than 100, This score is inaccurate")
-        pass
-    
-    score = 0.4*((totalWords/totalSentences) + 100*totalLongWords/totalSentences)
-    return score
+    # Only lengths are needed, so syllables aren't counted as they would be by _compute_base_stats.
+    if statistics is None:
+        totalWords = 0
+        totalSentences = len(text)
+        totalLongWords = 0
+        for sent in text:
+            totalWords += len(sent)
+            totalLongWords += sum(1 for token in sent if len(token)>6)
+    elif isinstance(statistics, BaseStats):
+        totalWords, totalSentences, totalLongWords = statistics.totalWords, statistics.totalSentences, statistics.totalLongWords
+    else:
+        totalWords, totalSentences, totalLongWords = statistics["totalWords"], statistics["totalSentences"], statistics["totalLongWords"]
+    try:
+        return GFI_A*((totalWords/totalSentences) + GFI_B*totalLongWords/totalSentences)
+    except ZeroDivisionError:
+        return float("nan")
 
 def ARI_score(text, statistics=None):
     """
@@ -49,21 +166,26 @@ def ARI_score(text, statistics=None):
     :param text: Content of a text, distincting between sentences.
     :type text: list(list(str)) or str 
     :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
-    :type statistics: readability.Statistics
-    :return: The Automated readability index of the current text
+    :type statistics: dict or BaseStats
+    :return: The Automated readability index of the current text, or nan if it has no words
     :rtype: float
     """
     #FIXME : this score is wrong since we multiplied each ratio by 4.71 instead of doing it only for the first one.
-    if statistics is not None:
-        return 4.71*((statistics["totalCharacters"]/statistics["totalWords"]) + 0.5*statistics["totalWords"]/statistics["totalSentences"])-21.43
-    totalWords = 0
-    totalSentences = len(text)
-    totalCharacters = 0
-    for sent in text:
-        totalWords += len(sent)
-        totalCharacters += sum(len(token) for token in sent)
-    score = 4.71*((totalCharacters/totalWords) + 0.5*totalWords/totalSentences)-21.43
-    return score
+    if statistics is None:
+        totalWords = 0
+        totalSentences = len(text)
+        totalCharacters = 0
+        for sent in text:
+            totalWords += len(sent)
+            totalCharacters += sum(map(len, sent))
+    elif isinstance(statistics, BaseStats):
+        totalWords, totalSentences, totalCharacters = statistics.totalWords, statistics.totalSentences, statistics.totalCharacters
+    else:
+        totalWords, totalSentences, totalCharacters = statistics["totalWords"], statistics["totalSentences"], statistics["totalCharacters"]
+    try:
+        return ARI_A*((totalCharacters/totalWords) + ARI_B*totalWords/totalSentences)-ARI_C
+    except ZeroDivisionError:
+        return float("nan")
 
 def FRE_score(text, statistics=None):
     """
@@ -74,20 +196,20 @@ def FRE_score(text, statistics=None):
     :param text: Content of a text, distincting between sentences.
     :type text: list(list(str)) or str 
     :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
-    :type statistics: readability.Statistics
-    :return: The Flesch reading ease of the current text
+    :type statistics: dict or BaseStats
+    :return: The Flesch reading ease of the current text, or nan if it has no words
     :rtype: float
     """
-    if statistics is not None:
-        return 206.835-1.015*(statistics["totalWords"]/statistics["totalSentences"])-84.6*(statistics["totalSyllables"]/statistics["totalWords"])
-    totalWords = 0
-    totalSentences = len(text)
-    totalSyllables = 0
-    for sent in text:
-        totalWords += len(sent)
-        totalSyllables += sum(utils.syllablesplit(word) for word in sent)
-    score_FRE = 206.835-1.015*(totalWords/totalSentences)-84.6*(totalSyllables/totalWords)
-    return(score_FRE)
+    if statistics is None:
+        statistics = _compute_base_stats(text)
+    if isinstance(statistics, BaseStats):
+        totalWords, totalSentences, totalSyllables = statistics.totalWords, statistics.totalSentences, statistics.totalSyllables
+    else:
+        totalWords, totalSentences, totalSyllables = statistics["totalWords"], statistics["totalSentences"], statistics["totalSyllables"]
+    try:
+        return FRE_A-FRE_B*(totalWords/totalSentences)-FRE_C*(totalSyllables/totalWords)
+    except ZeroDivisionError:
+        return float("nan")
 
 def FKGL_score(text, statistics=None):
     """
@@ -98,20 +220,20 @@ def FKGL_score(text, statistics=None):
     :param text: Content of a text, distincting between sentences.
     :type text: list(list(str)) or str 
     :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
-    :type statistics: readability.Statistics
-    :return: The Flesch–Kincaid grade level of the current text
+    :type statistics: dict or BaseStats
+    :return: The Flesch–Kincaid grade level of the current text, or nan if it has no words
     :rtype: float
     """
-    if statistics is not None:
-        return 0.39*(statistics["totalWords"]/statistics["totalSentences"])+11.8*(statistics["totalSyllables"]/statistics["totalWords"])-15.59
-    totalWords = 0
-    totalSentences = len(text)
-    totalSyllables = 0
-    for sent in text:
-        totalWords += len(sent)
-        totalSyllables += sum(utils.syllablesplit(word) for word in sent)
-    score_FKGL = 0.39*(totalWords/totalSentences)+11.8*(totalSyllables/totalWords)-15.59
-    return(score_FKGL)
+    if statistics is None:
+        statistics = _compute_base_stats(text)
+    if isinstance(statistics, BaseStats):
+        totalWords, totalSentences, totalSyllables = statistics.totalWords, statistics.totalSentences, statistics.totalSyllables
+    else:
+        totalWords, totalSentences, totalSyllables = statistics["totalWords"], statistics["totalSentences"], statistics["totalSyllables"]
+    try:
+        return FKGL_A*(totalWords/totalSentences)+FKGL_B*(totalSyllables/totalWords)-FKGL_C
+    except ZeroDivisionError:
+        return float("nan")
 
 def SMOG_score(text, statistics=None):
     """
@@ -122,21 +244,22 @@ def SMOG_score(text, statistics=None):
     :param text: Content of a text, distincting between sentences.
     :type text: list(list(str)) or str 
     :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
-    :type statistics: readability.Statistics
-    :return: The Simple Measure of Gobbledygook of the current text
+    :type statistics: dict or BaseStats
+    :return: The Simple Measure of Gobbledygook of the current text, or nan if it has no sentences
     :rtype: float
     """
     # FIXME : the nbPolysyllables erroneously returns their own number of syllables instead of incrementing the counter by one.
     # Keeping as is for now
-    if statistics is not None:
-        return 1.043*math.sqrt(statistics["nbPolysyllables"]*(30/statistics["totalSentences"]))+3.1291
-    totalSentences = len(text)
-    nbPolysyllables = 0
-    for sent in text:
-        nbPolysyllables += sum(utils.syllablesplit(word) for word in sent if utils.syllablesplit(word)>=3)
-        #nbPolysyllables += sum(1 for word in sent if utils.syllablesplit(word)>=3)
-    score_SMOG = 1.043*math.sqrt(nbPolysyllables*(30/totalSentences))+3.1291
-    return(score_SMOG)
+    if statistics is None:
+        statistics = _compute_base_stats(text)
+    if isinstance(statistics, BaseStats):
+        totalSentences, nbPolysyllables = statistics.totalSentences, statistics.nbPolysyllables
+    else:
+        totalSentences, nbPolysyllables = statistics["totalSentences"], statistics["nbPolysyllables"]
+    try:
+        return SMOG_A*math.sqrt(nbPolysyllables*(SMOG_SENTENCES/totalSentences))+SMOG_B
+    except ZeroDivisionError:
+        return float("nan")
 
 def REL_score(text, statistics=None):
     """
@@ -147,17 +270,174 @@ def REL_score(text, statistics=None):
     :param text: Content of a text, distincting between sentences.
     :type text: list(list(str)) or str 
     :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
-    :type statistics: readability.Statistics
-    :return: The Simple Measure of Gobbledygook of the current text
+    :type statistics: dict or BaseStats
+    :return: The Reading Ease Level of the current text, or nan if it has no words
     :rtype: float
     """
-    if statistics is not None:
-        return 207-1.015*(statistics["totalWords"]/statistics["totalSentences"])-73.6*(statistics["totalSyllables"]/statistics["totalWords"])
-    totalWords = 0
-    totalSentences = len(text)
-    totalSyllables = 0
-    for sent in text:
-        totalWords += len(sent)
-        totalSyllables += sum(utils.syllablesplit(word) for word in sent)
-    score_REL = 207-1.015*(totalWords/totalSentences)-73.6*(totalSyllables/totalWords)
-    return(score_REL)
\ No newline at end of file
+    if statistics is None:
+        statistics = _compute_base_stats(text)
+    if isinstance(statistics, BaseStats):
+        totalWords, totalSentences, totalSyllables = statistics.totalWords, statistics.totalSentences, statistics.totalSyllables
+    else:
+        totalWords, totalSentences, totalSyllables = statistics["totalWords"], statistics["totalSentences"], statistics["totalSyllables"]
+    try:
+        return REL_A-REL_B*(totalWords/totalSentences)-REL_C*(totalSyllables/totalWords)
+    except ZeroDivisionError:
+        return float("nan")
+
+
+# The following functions calculate every score at once, sharing the base statistics between them.
+def compute_all_scores(text, statistics=None):
+    """
+    Outputs the GFI, ARI, FRE, FKGL, SMOG and REL scores of a text, only calculating its base statistics once.
+
+    :param text: Content of a text, distincting between sentences.
+    :type text: list(list(str))
+    :param statistics: Refers to a readability.Statistics attribute, containing various pre-calculated information such as totalWords.
+    :type statistics: dict or BaseStats
+    :return: A dictionary associating each score's acronym with its value.
+    :rtype: dict
+    """
+    if statistics is None:
+        statistics = _compute_base_stats(text)
+    return dict(
+        GFI=GFI_score(text, statistics),
+        ARI=ARI_score(text, statistics),
+        FRE=FRE_score(text, statistics),
+        FKGL=FKGL_score(text, statistics),
+        SMOG=SMOG_score(text, statistics),
+        REL=REL_score(text, statistics),
+    )
+
+def score_corpus(texts, n_workers=None, mp_context=None):
+    """
+    Outputs the scores of compute_all_scores for several texts, dispatching the texts to a pool of processes.
+
+    Texts are independent from each other, so they are sent by chunks to each worker in order to limit the cost of communicating with them.
+    Scoring a text only takes microseconds, so the pool is only worth using for large corpora of long texts : otherwise compute_all_scores_batch is faster.
+    Keep in mind that with the "spawn" start method (the default on macOS and Windows), each worker imports this library again,
+    including torch, transformers and gensim through the utils module, which takes seconds. The main module must then also be guarded by if __name__ == "__main__".
+
+    :param texts: List of texts, each being a list of sentences, which are lists of words.
+    :type texts: list(list(list(str)))
+    :param int n_workers: Number of processes to use, defaults to the number of processors of the machine.
+    :param mp_context: Start method of the processes, e.g. multiprocessing.get_context("fork"), defaults to the one of the platform.
+    :type mp_context: multiprocessing.context.BaseContext
+    :return: A list containing the dictionary returned by compute_all_scores for each text, in the same order.
+    :rtype: list(dict)
+    """
+    workers = n_workers or os.cpu_count() or 1
+    chunksize = max(1, len(texts) // workers // 4)
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as pool:
+        return list(pool.map(compute_all_scores, texts, chunksize=chunksize))
+
+def _batch_base_stats(texts):
+    """
+    Calculates the base statistics of several texts, stored as one array per statistic rather than one BaseStats per text.
+
+    :param texts: List of texts, each being a list of sentences, which are lists of words.
+    :type texts: list(list(list(str)))
+    :return: The arrays for totalWords, totalSentences, totalCharacters, totalSyllables, nbPolysyllables and totalLongWords, in that order.
+    :rtype: tuple(numpy.ndarray)
+    """
+    # One row per statistic, each being contiguous in memory.
+    statistics = np.empty((len(BaseStats.__slots__), len(texts)), dtype=np.float64)
+    for index, text in enumerate(texts):
+        statistics[:, index] = _count_base_stats(text)
+    return tuple(statistics)
+
+def _scores_from_arrays(tw, ts, tc, tsy, tp, tl):
+    """
+    Applies the formulas of the GFI, ARI, FRE, FKGL, SMOG and REL scores to arrays of base statistics, one element per text.
+
+    :return: A dictionary associating each score's acronym with an array containing its value for each text.
+    :rtype: dict
+    """
+    # Only two divisions per text : the ratios shared by the formulas are obtained by multiplying with the reciprocals.
+    # Texts without sentences or words get a nan reciprocal, which then propagates to the scores that can't be calculated.
+    inv_ts = np.divide(1.0, ts, out=np.full_like(ts, np.nan), where=ts > 0)
+    inv_tw = np.divide(1.0, tw, out=np.full_like(tw, np.nan), where=tw > 0)
+    wps = tw*inv_ts
+    spw = tsy*inv_tw
+    return dict(
+        GFI=GFI_A*(wps + GFI_B*tl*inv_ts),
+        ARI=ARI_A*(tc*inv_tw + ARI_B*wps)-ARI_C,
+        FRE=FRE_A-FRE_B*wps-FRE_C*spw,
+        FKGL=FKGL_A*wps+FKGL_B*spw-FKGL_C,
+        SMOG=SMOG_A*np.sqrt(tp*(SMOG_SENTENCES*inv_ts))+SMOG_B,
+        REL=REL_A-REL_B*wps-REL_C*spw,
+    )
+
+# Order of the columns filled by the scores kernel.
+_SCORE_NAMES = ["GFI", "ARI", "FRE", "FKGL", "SMOG", "REL"]
+
+def _scores_kernel_numpy(tw, ts, tc, tsy, tp, tl, out):
+    """Writes the scores obtained from _scores_from_arrays in out, an array of shape (number of texts, 6) following the order of _SCORE_NAMES."""
+    scores = _scores_from_arrays(tw, ts, tc, tsy, tp, tl)
+    for column, name in enumerate(_SCORE_NAMES):
+        out[:, column] = scores[name]
+
+def _scores_loop(tw, ts, tc, tsy, tp, tl, out):
+    """Same as _scores_kernel_numpy, but every formula is applied in a single loop over the texts instead of one pass per operation : meant to be compiled by numba."""
+    for i in range(tw.size):
+        inv_ts = 1.0/ts[i] if ts[i] > 0 else math.nan
+        inv_tw = 1.0/tw[i] if tw[i] > 0 else math.nan
+        wps = tw[i]*inv_ts
+        spw = tsy[i]*inv_tw
+        out[i, 0] = GFI_A*(wps + GFI_B*tl[i]*inv_ts)
+        out[i, 1] = ARI_A*(tc[i]*inv_tw + ARI_B*wps)-ARI_C
+        out[i, 2] = FRE_A-FRE_B*wps-FRE_C*spw
+        out[i, 3] = FKGL_A*wps+FKGL_B*spw-FKGL_C
+        out[i, 4] = SMOG_A*math.sqrt(tp[i]*(SMOG_SENTENCES*inv_ts))+SMOG_B
+        out[i, 5] = REL_A-REL_B*wps-REL_C*spw
+
+# Set by _get_scores_kernel on the first batch call, so that numba isn't imported when the module is loaded.
+_scores_kernel = None
+
+def _get_scores_kernel():
+    """Returns the function filling the scores array : _scores_loop compiled by numba if it is installed, _scores_kernel_numpy otherwise."""
+    global _scores_kernel
+    if _scores_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _scores_kernel = _scores_kernel_numpy
+        else:
+            # Every fast-math flag is allowed except those assuming the absence of nan or inf, since nan is used for empty texts.
+            # "afn" lets math.sqrt be lowered to an approximate vectorized square root, which stays well within the precision scores are reported with.
+            _scores_kernel = njit(fastmath={"nsz", "arcp", "contract", "reassoc", "afn"}, cache=True)(_scores_loop)
+    return _scores_kernel
+
+def score_corpus_into(texts, out=None):
+    """
+    Writes the GFI, ARI, FRE, FKGL, SMOG and REL scores of several texts into an array, rather than into a dictionary per text like compute_all_scores.
+
+    The statistics of each text are written straight into numpy arrays, the only objects created per text being the integers counted by the statistics pass.
+
+    :param texts: List of texts, each being a list of sentences, which are lists of words.
+    :type texts: list(list(list(str)))
+    :param out: Array of shape (number of texts, 6) that will contain the scores, in the order GFI, ARI, FRE, FKGL, SMOG, REL. Allocated if not given.
+    :type out: numpy.ndarray
+    :return: The out array, containing one row per text and one column per score.
+    :rtype: numpy.ndarray
+    """
+    shape = (len(texts), len(_SCORE_NAMES))
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    elif out.shape != shape or out.dtype != np.float64:
+        raise ValueError("out must be a float64 array of shape " + str(shape) + ", got " + str(out.dtype) + " array of shape " + str(out.shape))
+    _get_scores_kernel()(*_batch_base_stats(texts), out)
+    return out
+
+def compute_all_scores_batch(texts):
+    """
+    Outputs the GFI, ARI, FRE, FKGL, SMOG and REL scores of several texts, the formulas being applied to every text at once.
+
+    :param texts: List of texts, each being a list of sentences, which are lists of words.
+    :type texts: list(list(list(str)))
+    :return: A dataframe with one row per text, and one column per score.
+    :rtype: pandas.DataFrame
+    """
+    # pandas is only needed by this function, so this module doesn't import it at the top (it is still loaded through the utils module).
+    import pandas as pd
+    return pd.DataFrame(score_corpus_into(texts), columns=_SCORE_NAMES)
@@ -47,16 +47,16 @@ def generate_corpus_from_folder(folder_path):
             corpus[top.split(os.path.sep)[-1]] = globals()[top.split(os.path.sep)[-1]]
     return corpus
 
+_SYLLABLE_VOWELS = frozenset('aeiouy')
+
 # TODO: improve this
 def syllablesplit(input):
     """Estimates the number of syllables in a word, by counting the number of vowels."""
     nb_syllabes = 0
-    syllables='aeiouy'
     for char in input:
-        for syl in syllables:
-            if syl == unidecode(char.lower()):
-                nb_syllabes+=1
-                break
+        # Transliterate each character once, rather than once per vowel it is compared to.
+        if unidecode(char.lower()) in _SYLLABLE_VOWELS:
+            nb_syllabes+=1
     return nb_syllabes
 
 
@@ -0,0 +1,15 @@
+# Metadata lives in setup.cfg, this file only declares the optional compiled extension.
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    # optional=True : a failed compilation doesn't prevent the installation, common_scores then uses its numpy version.
+    ext_modules = cythonize(
+        [Extension("readability.stats._base_stats", ["readability/stats/_base_stats.pyx"], optional=True)],
+        compiler_directives=dict(language_level=3),
+    )
+
+setup(ext_modules=ext_modules)